@@ -1,63 +1,226 @@
+import asyncio
 import os
-from typing import List, Optional, Literal, Dict, Any
-from fastapi import FastAPI, HTTPException
+import re
+import time
+from enum import IntEnum
+from typing import Annotated, List, Optional, Literal, Dict, Any, Tuple
+import ahocorasick
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_serializer
 
-app = FastAPI(title="Sjakie – AI SuperApp API", version="1.0.0")
+from scoring import score_future_self
+
+app = FastAPI(
+    title="Sjakie – AI SuperApp API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
+    # No endpoint uses cookies or auth, so Access-Control-Allow-Credentials is
+    # not sent: browser calls with credentials: "include" are rejected. Requests
+    # carrying a cookie still get their Origin echoed back by Starlette.
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers cache preflight responses for a day.
+    max_age=86400,
 )
 
 
+_MSGSPEC_PATH_PART = re.compile(r"\.(\w+)|\[(\d+)\]")
+_MSGSPEC_MISSING_FIELD = re.compile(r"Object missing required field `(\w+)`")
+_MSGSPEC_BYTE_OFFSET = re.compile(r"\(byte (\d+)\)")
+_MSGSPEC_CONSTRAINT = re.compile(r"Expected `[^`]+` (<=|>=|<|>) (\S+)")
+_MSGSPEC_WRONG_TYPE = re.compile(r"Expected `(\w+)[^`]*`, got `(\w+)`")
+
+# msgspec comparison -> (Pydantic error type, ctx key)
+_CONSTRAINT_TYPES = {
+    "<=": ("less_than_equal", "le"),
+    ">=": ("greater_than_equal", "ge"),
+    "<": ("less_than", "lt"),
+    ">": ("greater_than", "gt"),
+}
+# expected msgspec type -> Pydantic error type
+_WRONG_TYPE_TYPES = {
+    "int": "int_type",
+    "float": "float_type",
+    "str": "string_type",
+    "object": "model_attributes_type",
+}
+
+
+def _input_at(body: bytes, path: List[Any]) -> Any:
+    """Return the raw JSON value at path in body, or None if it isn't there."""
+    value = msgspec.json.decode(body)
+    for part in path:
+        try:
+            value = value[part]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value
+
+
+def _msgspec_errors(e: msgspec.DecodeError, body: bytes) -> List[Dict[str, Any]]:
+    """Translate a msgspec error into FastAPI's validation error list.
+
+    msgspec stops at the first problem, so the list has a single entry. The
+    mapping relies on msgspec's message wording; tests/test_request_validation.py
+    pins it.
+    """
+    if not body:
+        return [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+    if not isinstance(e, msgspec.ValidationError):
+        offset = _MSGSPEC_BYTE_OFFSET.search(str(e))
+        loc = ("body", int(offset.group(1))) if offset else ("body",)
+        return [{"type": "json_invalid", "loc": loc, "msg": "JSON decode error", "input": {}, "ctx": {"error": str(e)}}]
+
+    msg, _, path = str(e).rpartition(" - at `")
+    if not msg:
+        msg, path = str(e), "$"
+    fields: List[Any] = [name or int(index) for name, index in _MSGSPEC_PATH_PART.findall(path.rstrip("`"))]
+    value = _input_at(body, fields)
+    error: Dict[str, Any] = {"type": "value_error", "loc": ("body", *fields), "msg": msg, "input": value}
+
+    missing = _MSGSPEC_MISSING_FIELD.fullmatch(msg)
+    constraint = _MSGSPEC_CONSTRAINT.fullmatch(msg)
+    wrong_type = _MSGSPEC_WRONG_TYPE.fullmatch(msg)
+    if missing:
+        error.update(type="missing", loc=("body", *fields, missing.group(1)), msg="Field required")
+    elif value is None and not fields:
+        # A JSON null body is treated like no body at all, as FastAPI does.
+        error.update(type="missing", msg="Field required")
+    elif constraint:
+        error_type, ctx_key = _CONSTRAINT_TYPES[constraint.group(1)]
+        error.update(type=error_type, ctx={ctx_key: msgspec.json.decode(constraint.group(2))})
+    elif wrong_type:
+        expected, got = wrong_type.groups()
+        if got == "str" and expected in ("int", "float"):
+            error["type"] = f"{expected}_parsing"
+        else:
+            error["type"] = _WRONG_TYPE_TYPES.get(expected, "value_error")
+    return [error]
+
+
+def _json_body(struct_type: type):
+    """Dependency that decodes the JSON request body into struct_type.
+
+    The msgspec decoder is built once per type. strict=False keeps Pydantic's
+    lax coercion (e.g. "3" or 3.0 for an int), except that booleans are no
+    longer accepted for numeric fields. Invalid bodies raise
+    RequestValidationError with FastAPI's {"detail": [{"type", "loc", "msg",
+    "input"}]} shape, a ("body", <field>) loc and Pydantic's error types for
+    missing, range, type and JSON errors; "msg" keeps msgspec's wording and
+    only the first error is reported.
+    """
+    decoder = msgspec.json.Decoder(struct_type, strict=False)
+
+    async def dependency(request: Request):
+        body = await request.body()
+        try:
+            return decoder.decode(body)
+        except msgspec.DecodeError as e:
+            raise RequestValidationError(_msgspec_errors(e, body))
+
+    return dependency
+
+
+def _json_body_openapi(struct_type: type) -> Dict[str, Any]:
+    """openapi_extra documenting struct_type as the route's JSON request body."""
+    _, components = msgspec.json.schema_components([struct_type])
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": components[struct_type.__name__]}},
+            "required": True,
+        }
+    }
+
+
+class _StaticResponse(Response):
+    """JSON response built once at import time and returned for every request.
+
+    Body and headers (including Content-Length) are computed up front. The header
+    list is copied per send because ASGI middleware may edit a start message's
+    headers in place, which would otherwise leak into every later response.
+    """
+
+    media_type = "application/json"
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": list(self.raw_headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+_ROOT_RESPONSE = _StaticResponse(content=orjson.dumps({"message": "Sjakie Backend is live"}))
+_HELLO_RESPONSE = _StaticResponse(content=orjson.dumps({"message": "Hello from Sjakie backend!"}))
+
+
 @app.get("/")
-def read_root():
-    return {"message": "Sjakie Backend is live"}
+async def read_root():
+    return _ROOT_RESPONSE
 
 
 @app.get("/api/hello")
-def hello():
-    return {"message": "Hello from Sjakie backend!"}
+async def hello():
+    return _HELLO_RESPONSE
 
 
 # ---------- Health: Hangover Mode ----------
-class HangoverRequest(BaseModel):
-    weight_kg: Optional[float] = Field(None, gt=30, lt=250)
-    severity: int = Field(2, ge=1, le=5, description="1=mild, 5=severe")
-    include_heart_rate: Optional[int] = Field(None, ge=40, le=220)
+class HangoverRequest(msgspec.Struct, frozen=True):
+    weight_kg: Optional[Annotated[float, msgspec.Meta(gt=30, lt=250)]] = None
+    severity: Annotated[int, msgspec.Meta(ge=1, le=5, description="1=mild, 5=severe")] = 2
+    include_heart_rate: Optional[Annotated[int, msgspec.Meta(ge=40, le=220)]] = None
+
+
+# Simple schedule (every ~60–90 minutes)
+_HANGOVER_SCHEDULE = (
+    {"time": "Now", "action": "Drink 500ml water 💧"},
+    {"time": "+60 min", "action": "Drink 300ml water + snack (banana/toast)"},
+    {"time": "+120 min", "action": "Electrolytes or bouillon"},
+    {"time": "+180 min", "action": "Drink 300ml water"},
+)
+
+_HANGOVER_TIPS = (
+    "Cafeïne kan je hartslag boosten – rustig aan met koffie.",
+    "Magnesium 200–400mg kan spierspanning verlichten.",
+    "Geen paracetamol combineren met veel alcohol in je bloed.",
+    "Slaap en licht bewegen > intens sporten vandaag.",
+)
+
+_HANGOVER_SUPPLEMENTS = (
+    {"name": "Elektrolyten", "note": "natrium/kalium aanvullen"},
+    {"name": "Magnesium", "note": "200–400mg"},
+    {"name": "Gemberthee", "note": "tegen misselijkheid"},
+)
+
+# Extra hydration (ml) per severity level 1..5
+_SEVERITY_BUMP = (0, 250, 500, 750, 1000)
 
 
-@app.post("/api/hangover")
-def hangover_mode(req: HangoverRequest):
+@app.post("/api/hangover", openapi_extra=_json_body_openapi(HangoverRequest))
+async def hangover_mode(req: HangoverRequest = Depends(_json_body(HangoverRequest))):
     # Base hydration target (ml): 35 ml/kg/day baseline + severity bump
     if req.weight_kg:
         base_ml = req.weight_kg * 35
     else:
         base_ml = 2000
 
-    severity_bump = [0, 250, 500, 750, 1000][req.severity - 1]
+    severity_bump = _SEVERITY_BUMP[req.severity - 1]
     target_ml = int(base_ml + severity_bump)
 
-    # Simple schedule (every ~60–90 minutes)
-    schedule = [
-        {"time": "Now", "action": "Drink 500ml water 💧"},
-        {"time": "+60 min", "action": "Drink 300ml water + snack (banana/toast)"},
-        {"time": "+120 min", "action": "Electrolytes or bouillon"},
-        {"time": "+180 min", "action": "Drink 300ml water"},
-    ]
-
-    tips = [
-        "Cafeïne kan je hartslag boosten – rustig aan met koffie.",
-        "Magnesium 200–400mg kan spierspanning verlichten.",
-        "Geen paracetamol combineren met veel alcohol in je bloed.",
-        "Slaap en licht bewegen > intens sporten vandaag.",
-    ]
-
     hr_flag = None
     if req.include_heart_rate:
         hr = req.include_heart_rate
@@ -68,13 +231,9 @@ def hangover_mode(req: HangoverRequest):
 
     return {
         "target_hydration_ml": target_ml,
-        "schedule": schedule,
-        "supplements": [
-            {"name": "Elektrolyten", "note": "natrium/kalium aanvullen"},
-            {"name": "Magnesium", "note": "200–400mg"},
-            {"name": "Gemberthee", "note": "tegen misselijkheid"},
-        ],
-        "tips": tips,
+        "schedule": _HANGOVER_SCHEDULE,
+        "supplements": _HANGOVER_SUPPLEMENTS,
+        "tips": _HANGOVER_TIPS,
         "flags": hr_flag,
         "voice": "Drink nu 500ml water 💧 – je got this."
     }
@@ -113,13 +272,9 @@ HARM_DB: Dict[str, Dict[str, Any]] = {
 }
 
 
-@app.get("/api/drugs/info")
-def drug_info(substance: str):
-    key = substance.strip().lower()
-    if key not in HARM_DB:
-        raise HTTPException(status_code=404, detail="Onbekend middel")
-    data = HARM_DB[key]
-    return {
+# HARM_DB is static, so every drug_info response is built once up front.
+_DRUG_RESPONSES: Dict[str, _StaticResponse] = {
+    key: _StaticResponse(content=orjson.dumps({
         "substance": key,
         "education": {
             "risks": data["risks"],
@@ -129,132 +284,261 @@ def drug_info(substance: str):
             "emergency_signs": data["red_flags"],
         },
         "voice": "Educatief, niet promotioneel. Blijf veilig. 🫶"
-    }
+    }))
+    for key, data in HARM_DB.items()
+}
 
 
-# ---------- Future Self (simple scoring) ----------
-class FutureSelfInput(BaseModel):
-    sleep_hours: float = Field(..., ge=0, le=14)
-    steps_per_day: int = Field(..., ge=0, le=50000)
-    alcohol_units_per_week: int = Field(..., ge=0, le=70)
-    screen_time_hours: float = Field(..., ge=0, le=18)
+_UNKNOWN_SUBSTANCE = _StaticResponse(status_code=404, content=orjson.dumps({"detail": "Onbekend middel"}))
 
+# Longer input can't be a known substance, so reject it before normalizing.
+_SUBSTANCE_MAX_LEN = 16
 
-@app.post("/api/future-self")
-def future_self_score(payload: FutureSelfInput):
-    # Simple weighted scoring (100 = great)
-    score = 100
 
-    # Sleep: target 7–9
-    if payload.sleep_hours < 7:
-        score -= int((7 - payload.sleep_hours) * 5)
-    elif payload.sleep_hours > 9:
-        score -= int((payload.sleep_hours - 9) * 3)
+@app.get("/api/drugs/info")
+async def drug_info(substance: str):
+    if not substance or len(substance) > _SUBSTANCE_MAX_LEN:
+        return _UNKNOWN_SUBSTANCE
+    # UI clients send the canonical key, so try it before strip()/lower().
+    response = _DRUG_RESPONSES.get(substance)
+    if response is None:
+        response = _DRUG_RESPONSES.get(substance.strip().lower())
+    if response is None:
+        return _UNKNOWN_SUBSTANCE
+    return response
 
-    # Steps: target 8k–12k
-    if payload.steps_per_day < 8000:
-        score -= int((8000 - payload.steps_per_day) / 400)
-    elif payload.steps_per_day > 15000:
-        score -= int((payload.steps_per_day - 15000) / 1000)
 
-    # Alcohol
-    score -= min(payload.alcohol_units_per_week * 2, 30)
+# Pre-encoded '"key":{...}' members, spliced together by drug_info_batch.
+_DRUG_BATCH_MEMBERS: Dict[str, bytes] = {
+    key: orjson.dumps(key) + b":" + response.body for key, response in _DRUG_RESPONSES.items()
+}
+_BATCH_MAX_SUBSTANCES = 20
+_TOO_MANY_SUBSTANCES = _StaticResponse(
+    status_code=422,
+    content=orjson.dumps({
+        "detail": [{
+            "type": "too_long",
+            "loc": ["query", "substances"],
+            "msg": f"Maximaal {_BATCH_MAX_SUBSTANCES} middelen per verzoek",
+            "ctx": {"max_length": _BATCH_MAX_SUBSTANCES},
+        }]
+    }),
+)
+
+
+# Several substances in one round-trip, e.g. ?substances=mdma,alcohol.
+# Unknown names are skipped; 404 only if none are known.
+@app.get("/api/drugs/info/batch")
+async def drug_info_batch(substances: str):
+    names = substances.split(",")
+    if len(names) > _BATCH_MAX_SUBSTANCES:
+        return _TOO_MANY_SUBSTANCES
+    keys = dict.fromkeys(name.strip().lower() for name in names)
+    members = [_DRUG_BATCH_MEMBERS[key] for key in keys if key in _DRUG_BATCH_MEMBERS]
+    if not members:
+        return _UNKNOWN_SUBSTANCE
+    return Response(content=b"{" + b",".join(members) + b"}", media_type="application/json")
+
 
-    # Screen time (>6 starts to deduct)
-    if payload.screen_time_hours > 6:
-        score -= int((payload.screen_time_hours - 6) * 3)
+# ---------- Future Self (simple scoring) ----------
+class FutureSelfInput(msgspec.Struct, frozen=True):
+    sleep_hours: Annotated[float, msgspec.Meta(ge=0, le=14)]
+    steps_per_day: Annotated[int, msgspec.Meta(ge=0, le=50000)]
+    alcohol_units_per_week: Annotated[int, msgspec.Meta(ge=0, le=70)]
+    screen_time_hours: Annotated[float, msgspec.Meta(ge=0, le=18)]
 
-    score = max(0, min(100, score))
 
-    # Dimensions
-    energy = max(0, min(100, 50 + (payload.sleep_hours - 7) * 8 - (payload.alcohol_units_per_week)))
-    mobility = max(0, min(100, 50 + (payload.steps_per_day - 8000) / 120))
-    mental = max(0, min(100, 60 - (payload.screen_time_hours - 3) * 6 + (payload.sleep_hours - 7) * 5))
-    injury = max(0, min(100, 70 - (payload.steps_per_day - 10000) / 200 - payload.alcohol_units_per_week))
+@app.post("/api/future-self", openapi_extra=_json_body_openapi(FutureSelfInput))
+async def future_self_score(payload: FutureSelfInput = Depends(_json_body(FutureSelfInput))):
+    score, energy, mobility, mental, injury = score_future_self(
+        payload.sleep_hours, payload.steps_per_day, payload.alcohol_units_per_week, payload.screen_time_hours
+    )
 
     summary = "Bro… Future You wordt een wandelende café latte als je zo doorgaat. ☕👀" if score < 60 else "Lekker bezig. Kleine tweaks en je future self glimt. ✨"
 
     return {
         "score": score,
         "dimensions": {
-            "energy": int(energy),
-            "mobility": int(mobility),
-            "mental_balance": int(mental),
-            "injury_risk": int(injury)
+            "energy": energy,
+            "mobility": mobility,
+            "mental_balance": mental,
+            "injury_risk": injury
         },
         "summary": summary
     }
 
 
 # ---------- Triage Assistant (rule-based v1) ----------
-class TriageTurn(BaseModel):
+class TriageTurn(msgspec.Struct, frozen=True):
     message: str
 
 class TriageState(BaseModel):
     chief_complaint: Optional[str] = None
     answers: List[Dict[str, str]] = []
 
+class TriageLevel(IntEnum):
+    EMERGENCY = 1
+    URGENT = 2
+    ROUTINE = 3
+
+
 class TriageStepResponse(BaseModel):
+    # Frozen so cached instances can be shared across requests.
+    model_config = ConfigDict(frozen=True)
+
     question: Optional[str] = None
     outcome: Optional[str] = None
-    level: Optional[Literal['emergency','urgent','routine']] = None
+    level: Optional[TriageLevel] = None
     tips: Optional[List[str]] = None
     tone: str
 
+    @field_serializer("level", when_used="json")
+    def _level_name(self, level: Optional[TriageLevel]) -> Optional[Literal['emergency','urgent','routine']]:
+        # Keep the wire format as 'emergency' / 'urgent' / 'routine'
+        return level.name.lower() if level is not None else None
 
-@app.post("/api/triage/start", response_model=TriageStepResponse)
-def triage_start(turn: TriageTurn):
+
+@app.post(
+    "/api/triage/start",
+    response_model=TriageStepResponse,
+    response_class=ORJSONResponse,
+    openapi_extra=_json_body_openapi(TriageTurn),
+)
+async def triage_start(turn: TriageTurn = Depends(_json_body(TriageTurn))):
     text = turn.message.lower()
     # Simple parsing for abdominal pain case
     if "buik" in text or "buikpijn" in text:
-        return TriageStepResponse(
+        return TriageStepResponse.model_construct(
             question="Oef, vervelend! Wanneer begon het? 🤔 (uren/dagen)",
+            outcome=None,
+            level=None,
+            tips=None,
             tone="Jong, vriendelijk, speels. Korte zinnen."
         )
-    return TriageStepResponse(
+    return TriageStepResponse.model_construct(
         question="Vertel kort wat er speelt. Waar doet het pijn of wat valt op?",
+        outcome=None,
+        level=None,
+        tips=None,
         tone="Empathisch en duidelijk."
     )
 
 
-class TriageNextInput(BaseModel):
-    context: str = Field(..., description="free text context or previous answer")
+class TriageNextInput(msgspec.Struct, frozen=True):
+    context: Annotated[str, msgspec.Meta(description="free text context or previous answer")]
     complaint: Optional[str] = None
     last_answer: Optional[str] = None
 
 
-@app.post("/api/triage/next", response_model=TriageStepResponse)
-def triage_next(data: TriageNextInput):
-    ctx = f"{data.complaint or ''} {data.context or ''} {data.last_answer or ''}".lower()
+# Keyword buckets for triage_next, matched in a single Aho-Corasick pass.
+_ABDOMINAL = 1
+_ONSET = 2
+_STABBING = 4
+_FEVER = 8
+_EMERGENCY = 16
+
+_TRIAGE_KEYWORDS = {
+    _ABDOMINAL: ("buik", "buikpijn", "maag", "onderbuik"),
+    _ONSET: ("uren", "gister", "gisteren", "vandaag", "net"),
+    _STABBING: ("stekend",),
+    _FEVER: ("koorts", "braak", "braken", "overgeven"),
+    _EMERGENCY: ("flauwvallen", "borstpijn", "kortademig"),
+}
+
+
+def _build_triage_automaton() -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for bucket, keywords in _TRIAGE_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, bucket)
+    automaton.make_automaton()
+    return automaton
+
+
+_TRIAGE_AUTOMATON = _build_triage_automaton()
+
 
+def _match_buckets(text: str) -> int:
+    """Return a bitmask of the keyword buckets found in text."""
+    found = 0
+    for _, bucket in _TRIAGE_AUTOMATON.iter(text):
+        found |= bucket
+    return found
+
+
+# The decision tree only has a handful of outcomes; build them once.
+_STEP_ASK_PAIN_TYPE = TriageStepResponse.model_construct(
+    question="Is het stekend of dof?", outcome=None, level=None, tips=None, tone="Kort en duidelijk."
+)
+_STEP_ASK_FEVER = TriageStepResponse.model_construct(
+    question="Heb je koorts of moet je braken? 🤒", outcome=None, level=None, tips=None, tone="Empathisch."
+)
+_STEP_APPENDICITIS = TriageStepResponse.model_construct(
+    question=None,
+    outcome="Dit klinkt serieus, maat. Kan appendicitis zijn. Bel je huisarts vandaag nog.",
+    level=TriageLevel.URGENT,
+    tips=["Niet eten/drinken als je misselijk bent", "Regel vervoer als lopen pijn doet"],
+    tone="Eerlijk en direct."
+)
+_STEP_ASK_PAIN_PATTERN = TriageStepResponse.model_construct(
+    question="Is de pijn constant of komt het in golven?", outcome=None, level=None, tips=None, tone="Neutral"
+)
+_STEP_EMERGENCY = TriageStepResponse.model_construct(
+    question=None,
+    outcome="Klinkt als spoed. Bel 112 of ga naar de SEH.",
+    level=TriageLevel.EMERGENCY,
+    tips=["Blijf niet alleen"],
+    tone="Urgent"
+)
+_STEP_ASK_LOCATION = TriageStepResponse.model_construct(
+    question="Oké. Waar zit het precies en hoe lang al?", outcome=None, level=None, tips=None, tone="Vriendelijk"
+)
+
+
+def _classify(found: int) -> TriageStepResponse:
+    """Map a bitmask of matched keyword buckets to its (shared, frozen) next step."""
     # Abdominal pain mini-tree
-    if any(k in ctx for k in ["buik", "buikpijn", "maag", "onderbuik"]):
-        if any(k in ctx for k in ["uren", "gister", "gisteren", "vandaag", "net"]):
-            return TriageStepResponse(question="Is het stekend of dof?", tone="Kort en duidelijk.")
-        if any(k in ctx for k in ["stekend"]):
-            return TriageStepResponse(question="Heb je koorts of moet je braken? 🤒", tone="Empathisch.")
-        if any(k in ctx for k in ["koorts", "braak", "braken", "overgeven"]):
-            return TriageStepResponse(
-                outcome="Dit klinkt serieus, maat. Kan appendicitis zijn. Bel je huisarts vandaag nog.",
-                level="urgent",
-                tips=["Niet eten/drinken als je misselijk bent", "Regel vervoer als lopen pijn doet"],
-                tone="Eerlijk en direct."
-            )
+    if found & _ABDOMINAL:
+        if found & _ONSET:
+            return _STEP_ASK_PAIN_TYPE
+        if found & _STABBING:
+            return _STEP_ASK_FEVER
+        if found & _FEVER:
+            return _STEP_APPENDICITIS
         # default follow-up
-        return TriageStepResponse(question="Is de pijn constant of komt het in golven?", tone="Neutral")
+        return _STEP_ASK_PAIN_PATTERN
 
     # Fallback generic path
-    if any(k in ctx for k in ["flauwvallen", "borstpijn", "kortademig"]):
-        return TriageStepResponse(
-            outcome="Klinkt als spoed. Bel 112 of ga naar de SEH.", level="emergency", tips=["Blijf niet alleen"], tone="Urgent"
-        )
+    if found & _EMERGENCY:
+        return _STEP_EMERGENCY
+
+    return _STEP_ASK_LOCATION
+
 
-    return TriageStepResponse(question="Oké. Waar zit het precies en hoe lang al?", tone="Vriendelijk")
+@app.post(
+    "/api/triage/next",
+    response_model=TriageStepResponse,
+    response_class=ORJSONResponse,
+    openapi_extra=_json_body_openapi(TriageNextInput),
+)
+async def triage_next(data: TriageNextInput = Depends(_json_body(TriageNextInput))):
+    ctx = f"{data.complaint or ''} {data.context or ''} {data.last_answer or ''}".lower()
+    return _classify(_match_buckets(ctx))
 
 
 # ---------- Utilities ----------
+# /test is polled as a health check; reuse a successful probe for a few seconds.
+_TEST_CACHE_TTL = 5.0
+_test_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
+    global _test_cache
+    if _test_cache is not None and time.monotonic() - _test_cache[0] < _TEST_CACHE_TTL:
+        return _test_cache[1]
+
+    healthy = True
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -271,22 +555,38 @@ def test_database():
             response["database_name"] = getattr(db, 'name', '✅ Connected')
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await asyncio.to_thread(db.list_collection_names)
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
+                healthy = False
                 response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
         else:
             response["database"] = "⚠️  Available but not initialized"
     except Exception:
+        healthy = False
         response["database"] = "❌ Database module not found"
 
     response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
     response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+
+    # Errors are never cached so the next poll retries the database.
+    _test_cache = (time.monotonic(), response) if healthy else None
     return response
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Handlers are stateless (caches are per-process), so scale out with workers.
+    workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+    # Multi-worker mode requires the app as an import string.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
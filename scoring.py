@@ -0,0 +1,43 @@
+"""
+Future Self Scoring
+
+Pure arithmetic behind the /api/future-self endpoint. Kept free of FastAPI and
+Pydantic so it can be compiled with Cython (see setup.py); the float-annotated
+arguments become C doubles in the compiled module.
+"""
+
+from typing import Tuple
+
+
+def score_future_self(sleep: float, steps: int, alcohol: int, screen: float) -> Tuple[int, int, int, int, int]:
+    """Return (score, energy, mobility, mental, injury) for the Future Self endpoint."""
+    # Simple weighted scoring (100 = great)
+    score = 100
+
+    # Sleep: target 7–9
+    if sleep < 7:
+        score -= int((7 - sleep) * 5)
+    elif sleep > 9:
+        score -= int((sleep - 9) * 3)
+
+    # Steps: target 8k–12k
+    if steps < 8000:
+        score -= int((8000 - steps) / 400)
+    elif steps > 15000:
+        score -= int((steps - 15000) / 1000)
+
+    # Alcohol
+    score -= min(alcohol * 2, 30)
+
+    # Screen time (>6 starts to deduct)
+    if screen > 6:
+        score -= int((screen - 6) * 3)
+
+    # Dimensions
+    return (
+        max(0, min(100, score)),
+        int(max(0, min(100, 50 + (sleep - 7) * 8 - alcohol))),
+        int(max(0, min(100, 50 + (steps - 8000) / 120))),
+        int(max(0, min(100, 60 - (screen - 3) * 6 + (sleep - 7) * 5))),
+        int(max(0, min(100, 70 - (steps - 10000) / 200 - alcohol))),
+    )
@@ -0,0 +1,21 @@
+"""
+Optional Cython build for the scoring hot path.
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The compiled scoring extension is picked up before scoring.py on import;
+without it the pure-Python module is used unchanged.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("setup.py only builds the optional Cython extension; run `pip install cython` first.")
+
+setup(
+    name="sjakie-backend",
+    ext_modules=cythonize(["scoring.py"], language_level=3),
+)
@@ -15,5 +15,12 @@ mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
 echo "Starting FastAPI server..."
-nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
+UVICORN_OPTS="--host 0.0.0.0 --port 8000 --loop uvloop --http httptools --no-access-log"
+# --reload can't be combined with --workers: set WEB_CONCURRENCY to run
+# multiple workers without reload (e.g. WEB_CONCURRENCY=$(( $(nproc) * 2 + 1 ))).
+if [ -n "$WEB_CONCURRENCY" ]; then
+  nohup uvicorn main:app $UVICORN_OPTS --workers "$WEB_CONCURRENCY" > logs/server.log 2>&1
+else
+  nohup uvicorn main:app $UVICORN_OPTS --reload > logs/server.log 2>&1 
+fi
 echo "Server started in background"
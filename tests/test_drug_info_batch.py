@@ -0,0 +1,55 @@
+"""/api/drugs/info/batch returns several drug_info payloads in one response."""
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def batch(substances):
+    return client.get("/api/drugs/info/batch", params={"substances": substances})
+
+
+def test_entries_match_single_endpoint():
+    response = batch("mdma,alcohol")
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body) == ["mdma", "alcohol"]
+    for key in body:
+        assert body[key] == client.get("/api/drugs/info", params={"substance": key}).json()
+
+
+def test_normalizes_case_and_whitespace():
+    response = batch(" MDMA ,\tCannabis")
+    assert response.status_code == 200
+    assert list(response.json()) == ["mdma", "cannabis"]
+
+
+def test_deduplicates_names():
+    response = batch("mdma,MDMA, mdma,alcohol,mdma")
+    assert list(response.json()) == ["mdma", "alcohol"]
+
+
+def test_skips_unknown_names():
+    response = batch("xyz,cocaine,,nope")
+    assert response.status_code == 200
+    assert list(response.json()) == ["cocaine"]
+
+
+def test_all_unknown_is_404():
+    response = batch("xyz,nope")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Onbekend middel"}
+
+
+def test_more_than_twenty_names_is_rejected():
+    response = batch(",".join(["mdma"] * 21))
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert isinstance(detail, list)
+    assert detail[0]["loc"] == ["query", "substances"]
+
+
+def test_twenty_names_is_allowed():
+    assert batch(",".join(["mdma"] * 20)).status_code == 200
@@ -0,0 +1,67 @@
+"""msgspec body errors keep FastAPI's 422 validation error shape."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def post_raw(path, body):
+    return client.post(path, content=body, headers={"content-type": "application/json"})
+
+
+def only_error(response):
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert isinstance(detail, list) and len(detail) == 1
+    return detail[0]
+
+
+def test_missing_field():
+    error = only_error(client.post("/api/future-self", json={"sleep_hours": 7}))
+    assert error["type"] == "missing"
+    assert error["loc"] == ["body", "steps_per_day"]
+    assert error["input"] == {"sleep_hours": 7}
+
+
+def test_out_of_range_value():
+    error = only_error(client.post("/api/hangover", json={"severity": 9}))
+    assert error["type"] == "less_than_equal"
+    assert error["loc"] == ["body", "severity"]
+    assert error["input"] == 9
+    assert error["ctx"] == {"le": 5}
+
+
+def test_wrong_type():
+    error = only_error(client.post("/api/triage/start", json={"message": 1}))
+    assert error["type"] == "string_type"
+    assert error["loc"] == ["body", "message"]
+    assert error["input"] == 1
+
+
+def test_malformed_json():
+    error = only_error(post_raw("/api/hangover", b"{bad"))
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 1]
+
+
+@pytest.mark.parametrize("body", [b"", b"null"])
+def test_empty_or_null_body(body):
+    error = only_error(post_raw("/api/hangover", body))
+    assert error["type"] == "missing"
+    assert error["loc"] == ["body"]
+    assert error["input"] is None
+
+
+@pytest.mark.parametrize("body", [{"severity": "3"}, {"severity": 3.0}, {"weight_kg": "80"}])
+def test_lax_numeric_coercion(body):
+    assert client.post("/api/hangover", json=body).status_code == 200
+
+
+def test_bool_is_not_an_int():
+    # Pydantic accepted true/false for int fields; msgspec does not.
+    error = only_error(client.post("/api/hangover", json={"severity": True}))
+    assert error["type"] == "int_type"
+    assert error["loc"] == ["body", "severity"]
@@ -0,0 +1,45 @@
+"""Shared _StaticResponse objects must not carry headers between requests."""
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+
+from main import _ROOT_RESPONSE, app
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/", "/api/drugs/info?substance=mdma", "/api/drugs/info?substance=nope"])
+def test_cors_headers_do_not_leak_between_requests(path):
+    # A cookie makes CORSMiddleware echo the Origin and add "Vary: Origin",
+    # both of which must stay scoped to that one response.
+    first = client.get(path, headers={"Origin": "https://a.example", "Cookie": "s=1"})
+    second = client.get(path, headers={"Origin": "https://b.example", "Cookie": "s=1"})
+    plain = client.get(path)
+
+    assert first.headers["access-control-allow-origin"] == "https://a.example"
+    assert second.headers["access-control-allow-origin"] == "https://b.example"
+    assert first.headers["vary"] == second.headers["vary"] == "Origin"
+    assert len(first.headers.raw) == len(second.headers.raw)
+
+    assert "access-control-allow-origin" not in plain.headers
+    assert "vary" not in plain.headers
+    assert plain.headers["content-length"] == str(len(plain.content))
+
+
+def test_send_in_place_edits_do_not_touch_shared_headers():
+    # Starlette's CORSMiddleware copies the list before editing it, but any
+    # ASGI middleware may append to message["headers"] directly.
+    before = list(_ROOT_RESPONSE.raw_headers)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            message["headers"].append((b"x-injected", b"1"))
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    for _ in range(2):
+        anyio.run(_ROOT_RESPONSE, {"type": "http"}, receive, send)
+
+    assert _ROOT_RESPONSE.raw_headers == before